@@ -0,0 +1,72 @@
+from typing import Tuple
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def rolling_hilo(
+    high: np.ndarray, low: np.ndarray, window: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling high, rolling low, days since high and days since low in a single pass.
+
+    Monotonic queues of row indices hold the window candidates: each row is pushed once and
+    popped at most once, so the whole sweep is O(N) regardless of `window`. Ties keep the most
+    recent row, and the days-since values stay 0 until the first full window. NaN prices are
+    skipped like `rolling(min_periods=1)` does; a window with no valid price gives NaN and 0 days.
+
+    Args:
+        high (np.ndarray): The 'High' prices, sorted by date.
+        low (np.ndarray): The 'Low' prices, sorted by date.
+        window (int): The number of days to look back.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The rolling high, rolling low,
+        days since high and days since low for every row.
+    """
+    n = high.shape[0]
+    roll_high = np.empty(n, dtype=np.float64)
+    roll_low = np.empty(n, dtype=np.float64)
+    days_since_high = np.zeros(n, dtype=np.int64)
+    days_since_low = np.zeros(n, dtype=np.int64)
+
+    max_queue = np.empty(n, dtype=np.int64)
+    min_queue = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(n):
+        # Drop older candidates that can no longer be the window extreme; NaN prices are skipped
+        if not np.isnan(high[i]):
+            while max_tail > max_head and high[i] >= high[max_queue[max_tail - 1]]:
+                max_tail -= 1
+            max_queue[max_tail] = i
+            max_tail += 1
+        if not np.isnan(low[i]):
+            while min_tail > min_head and low[i] <= low[min_queue[min_tail - 1]]:
+                min_tail -= 1
+            min_queue[min_tail] = i
+            min_tail += 1
+
+        # Drop the head once it falls out of the window
+        if max_tail > max_head and max_queue[max_head] <= i - window:
+            max_head += 1
+        if min_tail > min_head and min_queue[min_head] <= i - window:
+            min_head += 1
+
+        # An empty queue means the window holds no valid price
+        if max_tail > max_head:
+            roll_high[i] = high[max_queue[max_head]]
+            if i >= window - 1:
+                days_since_high[i] = i - max_queue[max_head]
+        else:
+            roll_high[i] = np.nan
+        if min_tail > min_head:
+            roll_low[i] = low[min_queue[min_head]]
+            if i >= window - 1:
+                days_since_low[i] = i - min_queue[min_head]
+        else:
+            roll_low[i] = np.nan
+
+    return roll_high, roll_low, days_since_high, days_since_low
+
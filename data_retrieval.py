@@ -1,8 +1,17 @@
+import asyncio
+import math
 import os
-import time
 from dotenv import load_dotenv
-import requests
+import aiohttp
+from aiolimiter import AsyncLimiter
+import orjson
 import pandas as pd
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 from datetime import datetime
 import utils
 
@@ -10,6 +19,14 @@ load_dotenv()  # Loads variables from .env file
 API_KEY = os.getenv("API_KEY")
 API_URL = os.getenv("API_URL")
 
+PAGE_LIMIT = 5000  # Maximum number of daily aggregates returned per request
+SECONDS_PER_AGGREGATE = 24 * 60 * 60
+MAX_CONCURRENT_REQUESTS = 5
+MAX_REQUESTS_PER_SECOND = 10
+MAX_RETRY_ATTEMPTS = 5
+RETRY_STATUSES = (429, 502, 503, 504)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=10)
+
 
 def fetch_crypto_data(crypto_pair: str, start_date: str) -> pd.DataFrame | None:
     """
@@ -23,48 +40,112 @@ def fetch_crypto_data(crypto_pair: str, start_date: str) -> pd.DataFrame | None:
         pd.DataFrame | None: A DataFrame containing the historical data, or None if no data is found.
     """
     crypto_pair = crypto_pair.replace("/", "-")
-    start_timestamp = utils.date_str_to_unix_timestamp(start_date)
-    all_data = pd.DataFrame()
-    to_ts = int(datetime.now().timestamp())
-
-    while to_ts > start_timestamp:
-        try:
-            response = requests.get(
-                API_URL,
-                params={
-                    "market": "cadli",
-                    "instrument": crypto_pair,
-                    "limit": 5000,
-                    "aggregate": 1,
-                    "fill": "true",
-                    "apply_mapping": "true",
-                    "response_format": "JSON",
-                    "to_ts": to_ts,
-                    "api_key": API_KEY,
-                },
-                headers={"Content-type": "application/json; charset=UTF-8"},
-            )
-
-            # Check if the response is successful
-            response.raise_for_status()
-
-            data = response.json().get("Data", [])
-            batch_data = utils.parse_response_data(data)
-
-            if batch_data.empty:
-                print("No more data available.")
-                break
-
-            all_data = pd.concat([all_data, batch_data])
-
-            # update to_ts to the minimum date in the batch
-            to_ts = utils.date_str_to_unix_timestamp(
-                batch_data["Date"].min().strftime("%Y-%m-%d")
-            )
-            time.sleep(1)
-
-        except requests.exceptions.RequestException as e:
-            print(f"API Request failed: {e}")
-            return None
-
-    return utils.filter_data_by_date(all_data, start_date)
+    # Parse the start date once; it is reused for the page count and the final filter
+    start = pd.Timestamp(start_date)
+    start_timestamp = int(start.timestamp())
+    now_ts = int(datetime.now().timestamp())
+
+    # Every page ends at a known to_ts, so the whole range can be requested up front
+    page_span = PAGE_LIMIT * SECONDS_PER_AGGREGATE
+    n_pages = max(1, math.ceil((now_ts - start_timestamp) / page_span))
+    to_ts_values = [now_ts - k * page_span for k in range(n_pages)]
+
+    try:
+        batches = asyncio.run(_fetch_pages(crypto_pair, to_ts_values))
+    except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+        print(f"API Request failed: {e}")
+        return None
+
+    batches = [batch_data for batch_data in batches if not batch_data.empty]
+    if len(batches) < n_pages:
+        print("No more data available.")
+
+    all_data = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    return utils.filter_data_by_date(all_data, start)
+
+
+async def _fetch_pages(crypto_pair: str, to_ts_values: list) -> list:
+    """
+    Fetch all pages concurrently, with at most `MAX_CONCURRENT_REQUESTS` in flight
+    and at most `MAX_REQUESTS_PER_SECOND` started each second.
+
+    Args:
+        crypto_pair (str): The cryptocurrency pair in the API's 'BTC-USD' format.
+        to_ts_values (list): The Unix timestamp each page ends at.
+
+    Returns:
+        list: One parsed DataFrame per page, in the order of `to_ts_values`.
+    """
+    params = {
+        "market": "cadli",
+        "instrument": crypto_pair,
+        "limit": PAGE_LIMIT,
+        "aggregate": 1,
+        "fill": "true",
+        "apply_mapping": "true",
+        "response_format": "JSON",
+    }
+    # The public endpoint works without a key
+    if API_KEY:
+        params["api_key"] = API_KEY
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, time_period=1)
+    # One pooled keep-alive connection per concurrent request, reused across pages
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=REQUEST_TIMEOUT,
+        headers={"Content-type": "application/json; charset=UTF-8"},
+    ) as session:
+        tasks = [
+            _fetch_page(session, semaphore, limiter, params, to_ts)
+            for to_ts in to_ts_values
+        ]
+        return await asyncio.gather(*tasks)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Check whether a request failed with a rate-limit or transient gateway error."""
+    return isinstance(exc, aiohttp.ClientResponseError) and exc.status in RETRY_STATUSES
+
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
+    reraise=True,
+)
+async def _fetch_page(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    limiter: AsyncLimiter,
+    params: dict,
+    to_ts: int,
+) -> pd.DataFrame:
+    """
+    Fetch and parse the page of daily aggregates ending at `to_ts`.
+
+    Rate-limited (HTTP 429) and gateway error (HTTP 502, 503, 504) responses are retried
+    with exponential back-off.
+
+    Args:
+        session (aiohttp.ClientSession): The session shared by all page requests.
+        semaphore (asyncio.Semaphore): Bounds the number of concurrent requests.
+        limiter (AsyncLimiter): Bounds the number of requests started per second.
+        params (dict): The query parameters shared by all page requests.
+        to_ts (int): The Unix timestamp the page ends at.
+
+    Returns:
+        pd.DataFrame: The parsed page data.
+    """
+    async with semaphore, limiter, session.get(
+        API_URL,
+        params={**params, "to_ts": to_ts},
+    ) as response:
+        # Check if the response is successful
+        response.raise_for_status()
+
+        # Parse the response body
+        data = orjson.loads(await response.read()).get("Data", [])
+        return utils.parse_response_data(data)
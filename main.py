@@ -5,6 +5,29 @@ from metrics_calculations import calculate_metrics
 from ml_model import train_model
 from utils import add_to_excel
 
+
+class _FetchFailed(Exception):
+    """Raised when the API request fails, so the failure is not cached."""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_fetch(crypto_pair: str, start_date: str) -> pd.DataFrame:
+    """Fetch the crypto data, reusing the result for an hour for the same pair and start date."""
+    df = fetch_crypto_data(crypto_pair, start_date)
+    if df is None:
+        # Streamlit does not cache exceptions, so the next click retries the request
+        raise _FetchFailed
+    return df
+
+
+@st.cache_resource(max_entries=8, ttl=3600, show_spinner=False)
+def _cached_train(
+    df_key: tuple, _df: pd.DataFrame, variable1: int, variable2: int
+) -> tuple:
+    """Train the model once per data fingerprint and variables; `_df` is excluded from hashing."""
+    return train_model(_df, variable1, variable2)
+
+
 # Streamlit app
 st.title("Crypto Historical Data Retrieval")
 
@@ -22,7 +45,11 @@ train_model_checkbox = st.checkbox("Train Model")
 
 # Button to fetch data
 if st.button("Fetch Data"):
-    df = fetch_crypto_data(crypto_pair, str(start_date))
+    try:
+        df = _cached_fetch(crypto_pair, str(start_date))
+    except _FetchFailed:
+        st.error("Failed to fetch data. Please try again.")
+        st.stop()
     st.success("Data fetched successfully!", icon="✅")
     new_df = calculate_metrics(df, variable1, variable2)
     st.write(new_df)
@@ -30,7 +57,14 @@ if st.button("Fetch Data"):
     add_to_excel(new_df, crypto_pair)
 
     if train_model_checkbox:
-        model, mse, mae, r2 = train_model(new_df, variable1, variable2)
+        # Cheap fingerprint of the data, so an unchanged frame reuses the trained model
+        df_key = (
+            crypto_pair,
+            len(new_df),
+            float(new_df["Close"].iloc[-1]),
+            int(new_df["Date"].iloc[-1].value),
+        )
+        model, mse, mae, r2 = _cached_train(df_key, new_df, variable1, variable2)
         st.success("Model trained successfully!", icon="✅")
         st.write(f"MSE: {mse:.4f}")
         st.write(f"MAE: {mae:.4f}")
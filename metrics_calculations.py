@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 from typing import Optional
 import utils
+from _numba_kernels import rolling_hilo
 
 
 def calculate_metrics(
@@ -41,36 +43,32 @@ def add_historical_metrics(data: pd.DataFrame, variable1: int) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The DataFrame with added historical metrics.
     """
-    # Historical high price
-    data[f"High_Last_{variable1}_Days"] = utils.calculate_historical_high(
-        data, variable1
+    # Historical high/low prices and days since each, in a single pass
+    roll_high, roll_low, days_since_high, days_since_low = rolling_hilo(
+        data["High"].to_numpy(dtype=np.float64),
+        data["Low"].to_numpy(dtype=np.float64),
+        variable1,
     )
 
-    # Days since high
-    data[f"Days_Since_High_Last_{variable1}_Days"] = [
-        utils.days_since_high(data, i, variable1) if i >= variable1 - 1 else 0
-        for i in range(len(data))
-    ]
-
-    # Percentage difference from historical high
-    data[f"%_Diff_From_High_Last_{variable1}_Days"] = utils.calculate_pct_diff(
-        data["Close"], data[f"High_Last_{variable1}_Days"]
-    )
-
-    # Historical low price
-    data[f"Low_Last_{variable1}_Days"] = utils.calculate_historical_low(data, variable1)
-
-    # Days since low
-    data[f"Days_Since_Low_Last_{variable1}_Days"] = [
-        utils.days_since_low(data, i, variable1) if i >= variable1 - 1 else 0
-        for i in range(len(data))
-    ]
-
-    # Percentage difference from historical low
-    data[f"%_Diff_From_Low_Last_{variable1}_Days"] = utils.calculate_pct_diff(
-        data["Close"], data[f"Low_Last_{variable1}_Days"]
-    )
-    return data
+    new_cols: dict[str, np.ndarray | pd.Series] = {
+        # Historical high price
+        f"High_Last_{variable1}_Days": roll_high,
+        # Days since high
+        f"Days_Since_High_Last_{variable1}_Days": days_since_high,
+        # Percentage difference from historical high
+        f"%_Diff_From_High_Last_{variable1}_Days": utils.calculate_pct_diff(
+            data["Close"], roll_high
+        ),
+        # Historical low price
+        f"Low_Last_{variable1}_Days": roll_low,
+        # Days since low
+        f"Days_Since_Low_Last_{variable1}_Days": days_since_low,
+        # Percentage difference from historical low
+        f"%_Diff_From_Low_Last_{variable1}_Days": utils.calculate_pct_diff(
+            data["Close"], roll_low
+        ),
+    }
+    return pd.concat([data, pd.DataFrame(new_cols, index=data.index)], axis=1)
 
 
 def add_future_metrics(data: pd.DataFrame, variable2: int) -> pd.DataFrame:
@@ -84,19 +82,21 @@ def add_future_metrics(data: pd.DataFrame, variable2: int) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The DataFrame with added future metrics.
     """
-    # Future high price
-    data[f"High_Next_{variable2}_Days"] = utils.calculate_future_high(data, variable2)
-
-    # Percentage difference from future high
-    data[f"%_Diff_From_High_Next_{variable2}_Days"] = utils.calculate_pct_diff(
-        data["Close"], data[f"High_Next_{variable2}_Days"]
-    )
-
-    # Future low price
-    data[f"Low_Next_{variable2}_Days"] = utils.calculate_future_low(data, variable2)
-
-    # Percentage difference from future low
-    data[f"%_Diff_From_Low_Next_{variable2}_Days"] = utils.calculate_pct_diff(
-        data["Close"], data[f"Low_Next_{variable2}_Days"]
-    )
-    return data
+    future_high = utils.calculate_future_high(data, variable2)
+    future_low = utils.calculate_future_low(data, variable2)
+
+    new_cols: dict[str, pd.Series] = {
+        # Future high price
+        f"High_Next_{variable2}_Days": future_high,
+        # Percentage difference from future high
+        f"%_Diff_From_High_Next_{variable2}_Days": utils.calculate_pct_diff(
+            data["Close"], future_high
+        ),
+        # Future low price
+        f"Low_Next_{variable2}_Days": future_low,
+        # Percentage difference from future low
+        f"%_Diff_From_Low_Next_{variable2}_Days": utils.calculate_pct_diff(
+            data["Close"], future_low
+        ),
+    }
+    return pd.concat([data, pd.DataFrame(new_cols, index=data.index)], axis=1)
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+from _numba_kernels import rolling_hilo
+
+
+def test_rolling_hilo_skips_nan_like_pandas():
+    high = np.array([5, np.nan, 7, 3, np.nan, 2, 8, 1], dtype=np.float64)
+    low = np.array([np.nan, np.nan, 4, 1, np.nan, np.nan, np.nan, 6], dtype=np.float64)
+
+    for window in range(1, len(high) + 1):
+        roll_high, roll_low, _, _ = rolling_hilo(high, low, window)
+        expected_high = pd.Series(high).rolling(window, min_periods=1).max()
+        expected_low = pd.Series(low).rolling(window, min_periods=1).min()
+        np.testing.assert_array_equal(roll_high, expected_high.to_numpy())
+        np.testing.assert_array_equal(roll_low, expected_low.to_numpy())
+
+
+def test_rolling_hilo_days_since_with_nan():
+    high = np.array([5, np.nan, 7, 3, np.nan, 2, 8, 1], dtype=np.float64)
+
+    roll_high, _, days_since_high, _ = rolling_hilo(high, high, 3)
+    np.testing.assert_array_equal(roll_high, [5, 5, 7, 7, 7, 3, 8, 8])
+    np.testing.assert_array_equal(days_since_high, [0, 0, 0, 1, 2, 2, 0, 1])
@@ -1,5 +1,6 @@
-from datetime import datetime
-from typing import Optional, Tuple
+from typing import Tuple
+import bottleneck as bn
+import numexpr as ne
 import numpy as np
 from openpyxl import load_workbook
 import pandas as pd
@@ -21,51 +22,44 @@ def add_to_excel(data: pd.DataFrame, sheet_name: str) -> None:
 
     filepath = "output.xlsx"
     try:
-        book = load_workbook(filepath)
-        if sheet_name in book.sheetnames:
-            # Append a suffix to the sheet name to make it unique
-            suffix = 1
-            new_sheet_name = f"{sheet_name}_{suffix}"
-            while new_sheet_name in book.sheetnames:
-                suffix += 1
-                new_sheet_name = f"{sheet_name}_{suffix}"
-            sheet_name = new_sheet_name
+        # Read-only mode streams the workbook and is enough to list the sheet names
+        book = load_workbook(filepath, read_only=True, keep_links=False)
+        sheet_names = set(book.sheetnames)
+        book.close()
+        mode = "a"
     except FileNotFoundError:
         # File does not exist, no need to check for sheet names
-        pass
+        sheet_names = set()
+        mode = "w"
+
+    if sheet_name in sheet_names:
+        # Append a suffix to the sheet name to make it unique
+        suffix = 1
+        new_sheet_name = f"{sheet_name}_{suffix}"
+        while new_sheet_name in sheet_names:
+            suffix += 1
+            new_sheet_name = f"{sheet_name}_{suffix}"
+        sheet_name = new_sheet_name
 
-    with pd.ExcelWriter(
-        filepath, engine="openpyxl", mode="a" if "book" in locals() else "w"
-    ) as writer:
+    with pd.ExcelWriter(filepath, engine="openpyxl", mode=mode) as writer:
         data.to_excel(writer, sheet_name=sheet_name, index=False)
 
 
 ###########     helper functions for data_retrieval.py     ############
-def date_str_to_unix_timestamp(date: str) -> int:
-    """
-    Convert a date string to a Unix timestamp
-
-    Args:
-    date (str): The date in the format 'YYYY-MM-DD'
-
-    Returns:
-    int: The Unix timestamp for the given date
-    """
-    return int(datetime.strptime(date, "%Y-%m-%d").timestamp())
-
-
-def filter_data_by_date(data: pd.DataFrame, start_date: str) -> pd.DataFrame:
+def filter_data_by_date(
+    data: pd.DataFrame, start_date: str | pd.Timestamp
+) -> pd.DataFrame:
     """
     Filter the data by the start date.
 
     Parameters:
     data (pd.DataFrame): DataFrame containing cryptocurrency data.
-    start_date (str): Start date to filter the data.
+    start_date (str | pd.Timestamp): Start date to filter the data.
 
     Returns:
     pd.DataFrame: Filtered DataFrame with data starting from the specified date.
     """
-    return data[data["Date"] >= start_date]
+    return data[data["Date"] >= pd.Timestamp(start_date)]
 
 
 def parse_response_data(data: list) -> pd.DataFrame:
@@ -78,83 +72,58 @@ def parse_response_data(data: list) -> pd.DataFrame:
     Returns:
     pd.DataFrame: Parsed DataFrame with cryptocurrency data.
     """
-    records = [
+    timestamps = np.fromiter(
+        (item["TIMESTAMP"] for item in data), dtype=np.int64, count=len(data)
+    )
+    return pd.DataFrame(
         {
-            "Date": datetime.utcfromtimestamp(item["TIMESTAMP"]),
-            "Open": item.get("OPEN"),
-            "High": item.get("HIGH"),
-            "Low": item.get("LOW"),
-            "Close": item.get("CLOSE"),
+            "Date": pd.to_datetime(timestamps, unit="s"),
+            "Open": np.array([item.get("OPEN") for item in data], dtype=np.float64),
+            "High": np.array([item.get("HIGH") for item in data], dtype=np.float64),
+            "Low": np.array([item.get("LOW") for item in data], dtype=np.float64),
+            "Close": np.array([item.get("CLOSE") for item in data], dtype=np.float64),
         }
-        for item in data
-    ]
-    return pd.DataFrame(records)
-
-
-###########     helper functions for metrics_calculations.py     ############
-def calculate_historical_high(data: pd.DataFrame, days: int) -> pd.Series:
-    """Calculate the historical high over the past `days` days."""
-
-    return data["High"].rolling(window=days, min_periods=1).max()
-
-
-def calculate_historical_low(data: pd.DataFrame, days: int) -> pd.Series:
-    """Calculate the historical low over the past `days` days."""
-
-    return data["Low"].rolling(window=days, min_periods=1).min()
-
-
-def days_since_high(data: pd.DataFrame, index: int, days: int) -> Optional[int]:
-    """Calculate the number of days since the historical high over the past `days` days."""
-
-    subset = data.loc[max(0, index - days + 1) : index]
-    high_value = subset["High"].max()
-    high_date = subset.loc[subset["High"] == high_value, "Date"].max()
-    return (
-        (data.loc[index, "Date"] - high_date).days if high_date is not pd.NaT else None
     )
 
 
-def days_since_low(data: pd.DataFrame, index: int, days: int) -> Optional[int]:
-    """Calculate the number of days since the historical low over the past `days` days."""
-
-    subset = data.loc[max(0, index - days + 1) : index]
-    low_value = subset["Low"].min()
-    low_date = subset.loc[subset["Low"] == low_value, "Date"].max()
-    return (data.loc[index, "Date"] - low_date).days if low_date is not pd.NaT else None
-
-
-def calculate_pct_diff(current: pd.Series, reference: pd.Series) -> pd.Series:
+###########     helper functions for metrics_calculations.py     ############
+def calculate_pct_diff(
+    current: pd.Series, reference: pd.Series | np.ndarray
+) -> pd.Series:
     """Calculate the percentage difference between two series."""
 
-    return round(((current - reference) / reference) * 100, 2)
+    pct_diff = ne.evaluate(
+        "(current - reference) / reference * 100",
+        local_dict={"current": current.to_numpy(), "reference": np.asarray(reference)},
+    )
+    return pd.Series(np.round(pct_diff, 2, out=pct_diff), index=current.index)
 
 
 def calculate_future_high(data: pd.DataFrame, days: int) -> pd.Series:
     """Calculate the future high over the next `days` days."""
 
-    future_high = [
-        (
-            data["High"].iloc[i + 1 : min(len(data), i + days)].max()
-            if i < len(data) - 1
-            else data["High"].iloc[i]
-        )
-        for i in range(len(data))
-    ]
+    high = data["High"].to_numpy(dtype=np.float64)
+    future_high = np.full(len(high), np.nan)
+    if days > 1 and len(high) > 1:
+        # Moving max over the reversed array looks ahead; skipping one row excludes the current day
+        window = min(days - 1, len(high))
+        future_high[:-1] = bn.move_max(high[::-1], window=window, min_count=1)[::-1][1:]
+    if len(high):
+        future_high[-1] = high[-1]
     return pd.Series(future_high, index=data.index)
 
 
 def calculate_future_low(data: pd.DataFrame, days: int) -> pd.Series:
     """Calculate the future low over the next `days` days."""
 
-    future_low = [
-        (
-            data["Low"].iloc[i + 1 : min(len(data), i + days)].min()
-            if i < len(data) - 1
-            else data["Low"].iloc[i]
-        )
-        for i in range(len(data))
-    ]
+    low = data["Low"].to_numpy(dtype=np.float64)
+    future_low = np.full(len(low), np.nan)
+    if days > 1 and len(low) > 1:
+        # Moving min over the reversed array looks ahead; skipping one row excludes the current day
+        window = min(days - 1, len(low))
+        future_low[:-1] = bn.move_min(low[::-1], window=window, min_count=1)[::-1][1:]
+    if len(low):
+        future_low[-1] = low[-1]
     return pd.Series(future_low, index=data.index)
 
 